@@ -27,7 +27,9 @@
       color: #f9fafb;
       font-family: system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
     }
-    .spin-slow {
+    /* Defensive: the overlay is display:none when idle, but some engines keep hidden keyframe
+       timers ticking, so only animate while .is-active (toggled by showOverlay/hideOverlay) */
+    .is-active .spin-slow {
       animation: spin 1.2s linear infinite;
     }
     @keyframes spin {
@@ -42,6 +44,8 @@
         rgba(212, 175, 55, 0.1) 80%
       );
       background-size: 200% 100%;
+    }
+    .is-active .progress-stripe {
       animation: progressMove 1.5s linear infinite;
     }
     @keyframes progressMove {
@@ -50,8 +54,12 @@
     }
   </style>
 
-  <!-- PayPal SDK: client ID injected by Flask -->
-  <script src="https://www.paypal.com/sdk/js?client-id={{ paypal_client_id }}&vault=true&intent=subscription&currency=USD"></script>
+  <!-- Logo is used in the header and the processing overlay; fetch it once, early -->
+  <link rel="preload" as="image" href="https://t6ht6kdwnezp05ut.public.blob.vercel-storage.com/WatchVIM%20-%20Content/WatchVIM_New_OTT_Logo.png" fetchpriority="high" />
+
+  <!-- PayPal SDK is loaded from the main script (see loadPayPal); warm up the connection early -->
+  <link rel="preconnect" href="https://www.paypal.com" />
+  <link rel="dns-prefetch" href="https://www.paypalobjects.com" />
 </head>
 <body class="min-h-screen flex flex-col items-center px-4 py-10 gap-10">
 
@@ -66,6 +74,7 @@
             src="https://t6ht6kdwnezp05ut.public.blob.vercel-storage.com/WatchVIM%20-%20Content/WatchVIM_New_OTT_Logo.png"
             alt="VIM Media logo"
             class="h-10 w-auto object-contain"
+            fetchpriority="high"
           />
         </div>
         <div>
@@ -241,7 +250,7 @@
     <!-- Footer -->
     <footer class="mt-6 border-t border-white/10 pt-4 flex flex-col sm:flex-row items-start sm:items-center justify-between gap-2">
       <p class="text-[11px] text-slate-400">
-        &copy; <span id="year"></span> VIM Media, LLC. All rights reserved.
+        &copy; <span id="year">{{ current_year or "" }}</span> VIM Media, LLC. All rights reserved.
       </p>
       <p class="text-[11px] text-slate-500">
         Built for post-production teams who live in timelines, bins, and multitrack madness.
@@ -258,6 +267,7 @@
               src="https://t6ht6kdwnezp05ut.public.blob.vercel-storage.com/WatchVIM%20-%20Content/WatchVIM_New_OTT_Logo.png"
               alt="VIM Media logo small"
               class="h-9 w-auto object-contain"
+              decoding="async"
             />
           </div>
           <span class="text-sm font-semibold text-slate-100">
@@ -268,7 +278,7 @@
         <div class="w-10 h-10 rounded-full border border-watchGold/60 border-t-transparent spin-slow"></div>
 
         <div class="w-full h-1.5 rounded-full bg-slate-800 overflow-hidden">
-          <div class="w-2/3 h-full progress-stripe"></div>
+          <div id="processingBar" class="h-full progress-stripe transition-[width] duration-300" style="width: 0%"></div>
         </div>
 
         <div>
@@ -279,6 +289,11 @@
             This can take a few minutes for 4K or RAW footage. Please keep this tab open.
           </p>
         </div>
+
+        <button id="cancelUploadButton" type="button"
+                class="hidden rounded-full border border-slate-500 px-3 py-1 text-[11px] font-semibold text-slate-200 hover:bg-slate-200 hover:text-black">
+          Cancel upload
+        </button>
       </div>
     </div>
   </div>
@@ -313,7 +328,14 @@
           </ul>
         </div>
         <div class="mt-3">
-          <div id="paypal-indie-sub"></div>
+          {% if paypal_plans.indie %}
+          <a id="paypal-indie-sub"
+             href="https://www.paypal.com/webapps/billing/plans/subscribe?plan_id={{ paypal_plans.indie }}"
+             target="_blank" rel="noopener"
+             class="inline-flex w-full justify-center rounded-full bg-watchGold px-3 py-1.5 text-[11px] font-semibold text-black hover:bg-yellow-400">
+            Subscribe with PayPal
+          </a>
+          {% endif %}
           <p class="mt-2 text-[11px] text-slate-500">
             Subscribe with PayPal. No separate VIM account needed yet.
           </p>
@@ -336,7 +358,14 @@
           </ul>
         </div>
         <div class="mt-3">
-          <div id="paypal-studio-sub"></div>
+          {% if paypal_plans.studio %}
+          <a id="paypal-studio-sub"
+             href="https://www.paypal.com/webapps/billing/plans/subscribe?plan_id={{ paypal_plans.studio }}"
+             target="_blank" rel="noopener"
+             class="inline-flex w-full justify-center rounded-full bg-watchGold px-3 py-1.5 text-[11px] font-semibold text-black hover:bg-yellow-400">
+            Subscribe with PayPal
+          </a>
+          {% endif %}
           <p class="mt-2 text-[11px] text-slate-500">
             Subscribe with PayPal for recurring studio usage.
           </p>
@@ -359,7 +388,14 @@
           </ul>
         </div>
         <div class="mt-3">
-          <div id="paypal-pro-sub"></div>
+          {% if paypal_plans.pro_studio %}
+          <a id="paypal-pro-sub"
+             href="https://www.paypal.com/webapps/billing/plans/subscribe?plan_id={{ paypal_plans.pro_studio }}"
+             target="_blank" rel="noopener"
+             class="inline-flex w-full justify-center rounded-full bg-watchGold px-3 py-1.5 text-[11px] font-semibold text-black hover:bg-yellow-400">
+            Subscribe with PayPal
+          </a>
+          {% endif %}
           <p class="mt-2 text-[11px] text-slate-500">
             Subscribe with PayPal for Pro-level volume.
           </p>
@@ -388,307 +424,12 @@
     </div>
   </section>
 
-  <!-- === MAIN SCRIPT (all same-origin calls) === -->
+  <!-- === Server-rendered config for static/app.js === -->
   <script>
-    // ===== Payment + PayPal config =====
-    const PAYMENT_REQUIRED = true;      // require PayPal before download
-    const PAY_PER_JOB_AMOUNT = "7.00";
-
-    // Plan IDs from backend (PAYPAL_PLANS in app.py)
-    const INDIE_PLAN_ID  = "{{ paypal_plans.indie }}";
-    const STUDIO_PLAN_ID = "{{ paypal_plans.studio }}";
-    const PRO_PLAN_ID    = "{{ paypal_plans.pro_studio }}";
-
-    document.getElementById('year').textContent = new Date().getFullYear();
-
-    const form = document.getElementById('uploadForm');
-    const statusEl = document.getElementById('status');
-    const filesInput = document.getElementById('files');
-    const fileListEl = document.getElementById('fileList');
-    const syncButton = document.getElementById('syncButton');
-    const overlay = document.getElementById('processingOverlay');
-    const processingStep = document.getElementById('processingStep');
-    const processingSub = document.getElementById('processingSub');
-    const paymentStatusEl = document.getElementById('paymentStatus');
-
-    const userStatusEl = document.getElementById('userStatus');
-    const profileLink = document.getElementById('profileLink');
-    const loginLink = document.getElementById('loginLink');
-    const signupLink = document.getElementById('signupLink');
-
-    let overlayTimer = null;
-    let isProcessing = false;
-    let hasPaid = !PAYMENT_REQUIRED;   // set to true if you want to test without PayPal
-    let currentJobId = null;
-    let currentJobStatus = null;
-
-    // All routes are on the SAME origin now (no BACKEND_BASE_URL needed)
-    loginLink.href  = "/login";
-    signupLink.href = "/signup";
-    profileLink.href = "/profile";
-
-    paymentStatusEl.textContent = PAYMENT_REQUIRED
-      ? 'Upload & preview first. When you are happy with the result, complete payment to unlock download.'
-      : 'Payment is disabled in this environment (testing mode).';
-
-    syncButton.disabled = false;
-
-    function renderFileList(files) {
-      if (!files.length) {
-        fileListEl.innerHTML = '<span class="text-slate-500">No files selected yet.</span>';
-        return;
-      }
-      const items = [];
-      for (const f of files) {
-        items.push(
-          '<li class="flex justify-between gap-3">' +
-            '<span class="truncate max-w-[14rem]">' + f.name + '</span>' +
-            '<span class="text-slate-500">' + (f.size / (1024*1024)).toFixed(1) + ' MB</span>' +
-          '</li>'
-        );
-      }
-      fileListEl.innerHTML = '<ul class="space-y-1">' + items.join("") + '</ul>';
-    }
-
-    filesInput.addEventListener('change', () => {
-      renderFileList(filesInput.files);
-    });
-
-    function setOverlayStep(step, sub) {
-      processingStep.textContent = step;
-      if (sub) processingSub.textContent = sub;
-    }
-
-    function showOverlay() {
-      isProcessing = true;
-      overlay.classList.remove('hidden');
-
-      const steps = [
-        ['Step 1/3: Uploading your media…', 'Large RAW and 4K files may take a little longer to reach our servers.'],
-        ['Step 2/3: Syncing audio & video waveforms…', 'We analyze camera scratch audio and your external recordings to find the best alignment.'],
-        ['Step 3/3: Building your multi-track .mov…', 'Creating an edit-ready file with separate tracks for scratch and external audio.'],
-      ];
-      let idx = 0;
-      setOverlayStep(steps[0][0], steps[0][1]);
-
-      if (overlayTimer) clearInterval(overlayTimer);
-      overlayTimer = setInterval(() => {
-        if (!isProcessing) {
-          clearInterval(overlayTimer);
-          return;
-        }
-        idx = (idx + 1) % steps.length;
-        setOverlayStep(steps[idx][0], steps[idx][1]);
-      }, 6000);
-    }
-
-    function hideOverlay() {
-      isProcessing = false;
-      overlay.classList.add('hidden');
-      if (overlayTimer) clearInterval(overlayTimer);
-    }
-
-    // ===== Pay-per-job with PayPal =====
-    if (window.paypal && PAYMENT_REQUIRED) {
-      paypal.Buttons({
-        style: {
-          layout: 'horizontal',
-          color: 'gold',
-          shape: 'pill',
-          label: 'pay'
-        },
-        createOrder: function(data, actions) {
-          return actions.order.create({
-            purchase_units: [{
-              description: 'VIM Media AudioSync Pay-per-Job',
-              amount: { value: PAY_PER_JOB_AMOUNT }
-            }]
-          });
-        },
-        onApprove: function(data, actions) {
-          return actions.order.capture().then(function(details) {
-            hasPaid = true;
-            paymentStatusEl.textContent = 'Payment received. You can now download the synced file for this job.';
-
-            if (currentJobId) {
-              fetch(`/paypal/mark-paid/${currentJobId}`, {
-                method: 'POST'
-              })
-                .then(r => r.json())
-                .then(markRes => {
-                  console.log('Marked job as paid:', markRes);
-                })
-                .catch(err => {
-                  console.error('Error marking job as paid:', err);
-                });
-            } else {
-              paymentStatusEl.textContent += ' (Upload your media to create a job.)';
-            }
-          });
-        },
-        onCancel: function() {
-          paymentStatusEl.textContent = 'Payment cancelled. You can try again when ready.';
-        },
-        onError: function(err) {
-          console.error(err);
-          paymentStatusEl.textContent = 'There was an error with PayPal. Please try again.';
-        }
-      }).render('#paypal-button-container');
-    } else if (!PAYMENT_REQUIRED) {
-      paymentStatusEl.textContent = 'Payment is disabled in this environment (testing mode).';
-    }
-
-    // ===== Subscription buttons (Indie / Studio / Pro) =====
-    if (window.paypal) {
-      if (INDIE_PLAN_ID) {
-        paypal.Buttons({
-          style: { color: 'gold', shape: 'pill', label: 'subscribe' },
-          createSubscription: function(data, actions) {
-            return actions.subscription.create({
-              plan_id: INDIE_PLAN_ID
-            });
-          },
-          onApprove: function(data, actions) {
-            alert('Thank you for subscribing to Indie Creator! (Subscription ID: ' + data.subscriptionID + ')');
-          },
-          onError: function(err) {
-            console.error(err);
-          }
-        }).render('#paypal-indie-sub');
-      }
-
-      if (STUDIO_PLAN_ID) {
-        paypal.Buttons({
-          style: { color: 'gold', shape: 'pill', label: 'subscribe' },
-          createSubscription: function(data, actions) {
-            return actions.subscription.create({
-              plan_id: STUDIO_PLAN_ID
-            });
-          },
-          onApprove: function(data, actions) {
-            alert('Thank you for subscribing to Studio! (Subscription ID: ' + data.subscriptionID + ')');
-          },
-          onError: function(err) {
-            console.error(err);
-          }
-        }).render('#paypal-studio-sub');
-      }
-
-      if (PRO_PLAN_ID) {
-        paypal.Buttons({
-          style: { color: 'gold', shape: 'pill', label: 'subscribe' },
-          createSubscription: function(data, actions) {
-            return actions.subscription.create({
-              plan_id: PRO_PLAN_ID
-            });
-          },
-          onApprove: function(data, actions) {
-            alert('Thank you for subscribing to Pro Studio! (Subscription ID: ' + data.subscriptionID + ')');
-          },
-          onError: function(err) {
-            console.error(err);
-          }
-        }).render('#paypal-pro-sub');
-      }
-    }
-
-    async function pollJobStatus(jobId) {
-      try {
-        const res = await fetch(`/job/${jobId}`);
-        if (!res.ok) {
-          console.error('Job status error', res.status);
-          return;
-        }
-        const data = await res.json();
-        currentJobStatus = data.status;
-
-        if (data.status === 'ready') {
-          hideOverlay();
-          const previewLink = data.previewUrl
-            ? `<a href="${data.previewUrl}" target="_blank" class="underline text-watchGold">Open preview</a>`
-            : '';
-          const downloadHint = PAYMENT_REQUIRED
-            ? 'Complete payment, then click “Download synced file”.'
-            : 'You can now download the synced file.';
-
-          statusEl.innerHTML = `
-            Job #${data.id} is <span class="text-watchGold font-semibold">ready</span>.<br/>
-            ${previewLink}<br/>
-            <button id="downloadButton"
-              class="mt-2 inline-flex items-center justify-center gap-2 px-3 py-1.5 rounded-full
-              bg-watchGold text-black text-xs font-semibold hover:bg-yellow-400">
-              Download synced file
-            </button>
-            <p class="text-[11px] text-slate-400 mt-1">${downloadHint}</p>
-          `;
-
-          const downloadBtn = document.getElementById('downloadButton');
-          if (downloadBtn) {
-            downloadBtn.addEventListener('click', () => {
-              if (PAYMENT_REQUIRED && !hasPaid) {
-                alert('Please complete payment before downloading. You can preview the result above.');
-                return;
-              }
-              window.location.href = `/download/${jobId}`;
-            });
-          }
-        } else if (data.status === 'error') {
-          hideOverlay();
-          statusEl.textContent = 'There was an error processing your job. Please contact VIM Media support.';
-        } else {
-          // still processing
-          setTimeout(() => pollJobStatus(jobId), 5000);
-        }
-      } catch (err) {
-        console.error('Error polling job:', err);
-      }
-    }
-
-    // ===== Upload & sync handler =====
-    form.addEventListener('submit', async (e) => {
-      e.preventDefault();
-
-      if (!filesInput.files.length) {
-        alert('Please select a file to upload (a .zip with your media is recommended).');
-        return;
-      }
-
-      const file = filesInput.files[0];
-
-      statusEl.textContent = 'Uploading your media and starting the sync… Please keep this tab open.';
-      showOverlay();
-
-      const formData = new FormData();
-      // Backend expects SINGLE field named "file"
-      formData.append('file', file);
-
-      try {
-        const res = await fetch('/upload', {
-          method: 'POST',
-          body: formData,
-        });
-
-        if (!res.ok) {
-          hideOverlay();
-          const text = await res.text();
-          statusEl.textContent = 'Error: ' + text;
-          return;
-        }
-
-        const data = await res.json();
-        currentJobId = data.jobId;
-        currentJobStatus = data.status;
-
-        statusEl.textContent = `Job #${currentJobId} created. Syncing… This may take a few minutes for large or RAW footage.`;
-
-        // Start polling status until ready
-        pollJobStatus(currentJobId);
-      } catch (err) {
-        console.error(err);
-        hideOverlay();
-        statusEl.textContent = 'Unexpected error. Please try again or contact VIM Media support.';
-      }
-    });
+    window.AUDIOSYNC_CONFIG = {
+      paypalClientId: "{{ paypal_client_id }}",
+    };
   </script>
+  <script src="{{ url_for('static', filename='app.js') }}" defer></script>
 </body>
 </html>
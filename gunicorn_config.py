@@ -1,3 +1,15 @@
 # gunicorn_config.py
 bind = "0.0.0.0:8080"
 workers = 2
+
+# Threaded workers: each process handles requests on a pool of threads, so
+# /job/<id> polls and previews are still answered while another thread in
+# the same worker is receiving a large upload or waiting on ffmpeg.
+worker_class = "gthread"
+threads = 4
+
+# With gthread the main thread heartbeats the arbiter regardless of how long
+# request threads run, so `timeout` (left at its default) only catches hung
+# workers. On reload/deploy, give in-flight syncs time to finish before the
+# worker is killed.
+graceful_timeout = 900
@@ -0,0 +1,363 @@
+// VIM Media AudioSync – index page script (all same-origin calls)
+
+// ===== Payment + PayPal config =====
+const PAYMENT_REQUIRED = true;      // require PayPal before download
+const PAY_PER_JOB_AMOUNT = "7.00";
+
+// Server-rendered values (see AUDIOSYNC_CONFIG in templates/index.html)
+const CONFIG = window.AUDIOSYNC_CONFIG || {};
+const PAYPAL_CLIENT_ID = CONFIG.paypalClientId || "";
+
+const BYTES_PER_MB = 1024 * 1024;
+
+// DOM handles used by the script, looked up once
+const EL = Object.freeze({
+  year: document.getElementById('year'),
+  form: document.getElementById('uploadForm'),
+  status: document.getElementById('status'),
+  files: document.getElementById('files'),
+  fileList: document.getElementById('fileList'),
+  syncButton: document.getElementById('syncButton'),
+  overlay: document.getElementById('processingOverlay'),
+  processingStep: document.getElementById('processingStep'),
+  processingSub: document.getElementById('processingSub'),
+  processingBar: document.getElementById('processingBar'),
+  cancelUpload: document.getElementById('cancelUploadButton'),
+  paymentStatus: document.getElementById('paymentStatus'),
+  userStatus: document.getElementById('userStatus'),
+  profileLink: document.getElementById('profileLink'),
+  loginLink: document.getElementById('loginLink'),
+  signupLink: document.getElementById('signupLink'),
+});
+
+// Footer year is rendered by Flask (current_year); only fill it in when the view didn't pass one
+if (!EL.year.textContent) {
+  EL.year.textContent = new Date().getFullYear();
+}
+
+let isProcessing = false;
+let currentUpload = null;          // AbortController for the in-flight /upload request
+let hasPaid = !PAYMENT_REQUIRED;   // set to true if you want to test without PayPal
+let currentJobId = null;
+let currentJobStatus = null;
+
+// All routes are on the SAME origin now (no BACKEND_BASE_URL needed)
+EL.loginLink.href  = "/login";
+EL.signupLink.href = "/signup";
+EL.profileLink.href = "/profile";
+
+EL.paymentStatus.textContent = PAYMENT_REQUIRED
+  ? 'Upload & preview first. When you are happy with the result, complete payment to unlock download.'
+  : 'Payment is disabled in this environment (testing mode).';
+
+EL.syncButton.disabled = false;
+
+function formatTotalSize(bytes) {
+  const mb = bytes / BYTES_PER_MB;
+  return mb >= 1024 ? (mb / 1024).toFixed(2) + ' GB' : mb.toFixed(1) + ' MB';
+}
+
+function renderFileList(files) {
+  if (!files.length) {
+    EL.fileList.innerHTML = '<span class="text-slate-500">No files selected yet.</span>';
+    return;
+  }
+  // Build the list detached from the document and attach it in one go (names go through textContent, not HTML)
+  const list = document.createElement('ul');
+  list.className = 'space-y-1';
+  let bytesTotal = 0;
+  for (const f of files) {
+    bytesTotal += f.size;
+    const item = document.createElement('li');
+    item.className = 'flex justify-between gap-3';
+
+    const name = document.createElement('span');
+    name.className = 'truncate max-w-[14rem]';
+    name.textContent = f.name;
+
+    const size = document.createElement('span');
+    size.className = 'text-slate-500';
+    size.textContent = (f.size / BYTES_PER_MB).toFixed(1) + ' MB';
+
+    item.append(name, size);
+    list.appendChild(item);
+  }
+
+  const summary = document.createElement('div');
+  summary.className = 'mb-2 text-slate-300';
+  summary.textContent = 'Selected: ' + files.length + (files.length === 1 ? ' file' : ' files') +
+    ' · ' + formatTotalSize(bytesTotal);
+  EL.fileList.replaceChildren(summary, list);
+}
+
+EL.files.addEventListener('change', () => {
+  renderFileList(EL.files.files);
+});
+
+function setOverlayStep(step, sub) {
+  EL.processingStep.textContent = step;
+  if (sub) EL.processingSub.textContent = sub;
+}
+
+function setOverlayProgress(fraction) {
+  EL.processingBar.style.width = Math.round(fraction * 100) + '%';
+}
+
+function showOverlay() {
+  isProcessing = true;
+  EL.syncButton.disabled = true;
+  EL.cancelUpload.classList.remove('hidden');
+  EL.overlay.classList.remove('hidden');
+  EL.overlay.classList.add('is-active');
+  setOverlayStep('Step 1/2: Uploading your media…', 'Large RAW and 4K files may take a little longer to reach our servers.');
+  setOverlayProgress(0);
+}
+
+function showUploadProgress(loaded, total) {
+  const fraction = total ? loaded / total : 0;
+  setOverlayStep(
+    `Step 1/2: Uploading your media… ${Math.floor(fraction * 100)}%`,
+    `${(loaded / BYTES_PER_MB).toFixed(1)} of ${(total / BYTES_PER_MB).toFixed(1)} MB sent. Please keep this tab open.`
+  );
+  setOverlayProgress(fraction);
+}
+
+function showSyncing() {
+  setOverlayStep(
+    'Step 2/2: Syncing audio & building your multi-track .mov…',
+    'We align camera scratch audio with your external recordings. This can take a few minutes for 4K or RAW footage.'
+  );
+  setOverlayProgress(1);
+}
+
+function hideOverlay() {
+  isProcessing = false;
+  EL.syncButton.disabled = false;
+  EL.overlay.classList.add('hidden');
+  EL.overlay.classList.remove('is-active');
+}
+
+// POST with XHR so the overlay can follow real upload progress (fetch has no upload events)
+function uploadWithProgress(url, formData, signal) {
+  return new Promise((resolve, reject) => {
+    const xhr = new XMLHttpRequest();
+    xhr.open('POST', url);
+    signal.addEventListener('abort', () => xhr.abort(), { once: true });
+    xhr.addEventListener('abort', () => reject(new DOMException('Upload cancelled', 'AbortError')));
+    xhr.upload.addEventListener('progress', (e) => {
+      if (e.lengthComputable) showUploadProgress(e.loaded, e.total);
+    });
+    xhr.upload.addEventListener('load', () => {
+      // Bytes are on the server now; cancelling would no longer stop the job
+      EL.cancelUpload.classList.add('hidden');
+      showSyncing();
+    });
+    xhr.addEventListener('load', () => resolve({
+      ok: xhr.status >= 200 && xhr.status < 300,
+      status: xhr.status,
+      text: xhr.responseText,
+    }));
+    xhr.addEventListener('error', () => reject(new Error('Network error during upload')));
+    xhr.send(formData);
+  });
+}
+
+// ===== Pay-per-job with PayPal =====
+function renderPayPerJobButton() {
+  if (window.paypal && PAYMENT_REQUIRED) {
+    paypal.Buttons({
+      style: {
+        layout: 'horizontal',
+        color: 'gold',
+        shape: 'pill',
+        label: 'pay'
+      },
+      createOrder: function(data, actions) {
+        return actions.order.create({
+          purchase_units: [{
+            description: 'VIM Media AudioSync Pay-per-Job',
+            amount: { value: PAY_PER_JOB_AMOUNT }
+          }]
+        });
+      },
+      onApprove: function(data, actions) {
+        return actions.order.capture().then(function(details) {
+          hasPaid = true;
+          EL.paymentStatus.textContent = 'Payment received. You can now download the synced file for this job.';
+
+          if (currentJobId) {
+            fetch(`/paypal/mark-paid/${currentJobId}`, {
+              method: 'POST'
+            })
+              .then(r => r.json())
+              .then(markRes => {
+                console.log('Marked job as paid:', markRes);
+              })
+              .catch(err => {
+                console.error('Error marking job as paid:', err);
+              });
+          } else {
+            EL.paymentStatus.textContent += ' (Upload your media to create a job.)';
+          }
+        });
+      },
+      onCancel: function() {
+        EL.paymentStatus.textContent = 'Payment cancelled. You can try again when ready.';
+      },
+      onError: function(err) {
+        console.error(err);
+        EL.paymentStatus.textContent = 'There was an error with PayPal. Please try again.';
+      }
+    }).render('#paypal-button-container');
+  }
+}
+
+// ===== PayPal SDK (loaded on demand so it never blocks first paint) =====
+// Subscription tiers link out to PayPal's hosted plan pages (see #pricing in the template),
+// so the SDK only has to power the pay-per-job button.
+const PAYPAL_SDK_URL = "https://www.paypal.com/sdk/js?client-id=" +
+  encodeURIComponent(PAYPAL_CLIENT_ID) + "&currency=USD";
+let paypalLoader = null;
+
+function loadPayPal() {
+  if (!paypalLoader) {
+    paypalLoader = new Promise((resolve, reject) => {
+      if (window.paypal) return resolve(window.paypal);
+      const script = document.createElement('script');
+      script.src = PAYPAL_SDK_URL;
+      script.async = true;
+      script.onload = () => resolve(window.paypal);
+      script.onerror = () => reject(new Error('Failed to load PayPal SDK'));
+      document.head.appendChild(script);
+    });
+  }
+  return paypalLoader;
+}
+
+function initPayPal() {
+  loadPayPal()
+    .then(renderPayPerJobButton)
+    .catch(err => {
+      console.error(err);
+      EL.paymentStatus.textContent = 'PayPal could not be loaded. Please refresh the page to try again.';
+    });
+}
+
+if (PAYMENT_REQUIRED) {
+  // Pay-per-job lives in the main card, so fetch the SDK once the page has been parsed
+  document.addEventListener('DOMContentLoaded', initPayPal, { once: true });
+}
+
+async function pollJobStatus(jobId) {
+  try {
+    const res = await fetch(`/job/${jobId}`);
+    if (!res.ok) {
+      console.error('Job status error', res.status);
+      return;
+    }
+    const data = await res.json();
+    currentJobStatus = data.status;
+
+    if (data.status === 'ready') {
+      hideOverlay();
+      const previewLink = data.previewUrl
+        ? `<a href="${data.previewUrl}" target="_blank" class="underline text-watchGold">Open preview</a>`
+        : '';
+      const downloadHint = PAYMENT_REQUIRED
+        ? 'Complete payment, then click “Download synced file”.'
+        : 'You can now download the synced file.';
+
+      EL.status.innerHTML = `
+        Job #${data.id} is <span class="text-watchGold font-semibold">ready</span>.<br/>
+        ${previewLink}<br/>
+        <button id="downloadButton"
+          class="mt-2 inline-flex items-center justify-center gap-2 px-3 py-1.5 rounded-full
+          bg-watchGold text-black text-xs font-semibold hover:bg-yellow-400">
+          Download synced file
+        </button>
+        <p class="text-[11px] text-slate-400 mt-1">${downloadHint}</p>
+      `;
+
+      const downloadBtn = document.getElementById('downloadButton');
+      if (downloadBtn) {
+        downloadBtn.addEventListener('click', () => {
+          if (PAYMENT_REQUIRED && !hasPaid) {
+            alert('Please complete payment before downloading. You can preview the result above.');
+            return;
+          }
+          window.location.href = `/download/${jobId}`;
+        });
+      }
+    } else if (data.status === 'error') {
+      hideOverlay();
+      EL.status.textContent = 'There was an error processing your job. Please contact VIM Media support.';
+    } else {
+      // still processing
+      setTimeout(() => pollJobStatus(jobId), 5000);
+    }
+  } catch (err) {
+    console.error('Error polling job:', err);
+  }
+}
+
+// ===== Upload & sync handler =====
+EL.cancelUpload.addEventListener('click', () => {
+  if (currentUpload) currentUpload.abort();
+});
+
+// Don't leave the server receiving bytes for a page that is gone
+window.addEventListener('pagehide', () => {
+  if (currentUpload) currentUpload.abort();
+});
+
+EL.form.addEventListener('submit', async (e) => {
+  e.preventDefault();
+
+  // A job is already uploading or syncing (e.g. a double-click on Sync)
+  if (isProcessing) return;
+
+  if (!EL.files.files.length) {
+    alert('Please select a file to upload (a .zip with your media is recommended).');
+    return;
+  }
+
+  const file = EL.files.files[0];
+
+  EL.status.textContent = 'Uploading your media and starting the sync… Please keep this tab open.';
+  showOverlay();
+
+  const formData = new FormData();
+  // Backend expects SINGLE field named "file"
+  formData.append('file', file);
+
+  currentUpload = new AbortController();
+
+  try {
+    const res = await uploadWithProgress('/upload', formData, currentUpload.signal);
+
+    if (!res.ok) {
+      hideOverlay();
+      EL.status.textContent = 'Error: ' + res.text;
+      return;
+    }
+
+    const data = JSON.parse(res.text);
+    currentJobId = data.jobId;
+    currentJobStatus = data.status;
+
+    EL.status.textContent = `Job #${currentJobId} created. Syncing… This may take a few minutes for large or RAW footage.`;
+
+    // Start polling status until ready
+    pollJobStatus(currentJobId);
+  } catch (err) {
+    hideOverlay();
+    if (err.name === 'AbortError') {
+      EL.status.textContent = 'Upload cancelled. Select your files and press Sync to try again.';
+      return;
+    }
+    console.error(err);
+    EL.status.textContent = 'Unexpected error. Please try again or contact VIM Media support.';
+  } finally {
+    currentUpload = null;
+  }
+});